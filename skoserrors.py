@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+The custom exceptions raised by skostools. They live in their own module,
+which does not import rdflib, so code that only needs to catch them does not
+pay for loading rdflib. skostools imports them, so skostools.SKOSError and
+the rest still work.
+"""
+
+# =============================================================================
+# Custom Exceptions
+# =============================================================================
+
+class SKOSError(Exception):
+    """Serves as base class for other custom errors. Do not use directly."""
+    
+    def __init__(self, exampleNumber, referenceURL, triple, message=None):
+        """
+        SKOS errors are raised when a user tries to add a triple that would violate the SKOS standard.
+
+        Parameters
+        ----------
+        triple : 3-tuple, optional
+            The triple the user attempted to add to masterGraph. The default is None.
+        exampleNumber : str, optional
+            The error number corresponds to the example number in the SKOS reference. The default is None.
+        referenceURL : str, optional
+            The URL of the SKOS refrence section which describes the violation that threw the exception. The default is None.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.err = exampleNumber
+        
+        self.ref = referenceURL
+        
+        self.tpl = triple
+        
+        self.msg = f"Triple {self.tpl} violates example {self.err} from {self.ref}."
+        
+        if message is not None:
+            self.msg = f"{self.msg} {message}"
+        
+        super().__init__(self.msg)
+
+class _SKOSRuleError(SKOSError):
+    """Serves as base class for errors that always cite the same example
+    number, reference URL, and message. Subclasses set _ERR, _REF, and
+    _DEFAULT_MSG instead of defining __init__."""
+    
+    _ERR = "N/A"
+    _REF = "N/A"
+    _DEFAULT_MSG = None
+    
+    def __init__(self, triple):
+        
+        SKOSError.__init__(self, self._ERR, self._REF, triple, self._DEFAULT_MSG)
+
+class ConflictingLabelError(_SKOSRuleError):
+    """It is an error if a concept has the same literal both as its preferred
+    label and as an alternative label or hidden label.
+    Source: https://www.w3.org/TR/skos-primer/#seclabel"""
+    _ERR = "S13"
+    _REF = "https://www.w3.org/TR/skos-reference/#L1567"
+    _DEFAULT_MSG = "A concept cannot have the same plain literal for two or more different label types."
+
+class DisjointMatchError(_SKOSRuleError):
+    """By convention, mapping relationships are expected to be asserted between
+    concepts that belong to different concept schemes.
+    Source: https://www.w3.org/TR/skos-primer/#secmapping"""
+    _ERR = "S46"
+    _REF = "https://www.w3.org/TR/skos-reference/#L5429"
+    _DEFAULT_MSG = "skos:exactMatch is disjoint with skos:broadMatch, skos:narrowMatch, and skos:relatedMatch."
+
+class DisjointRelationError(_SKOSRuleError):
+    """The transitive closure of skos:broader is disjoint from skos:related.
+    If resources A and B are related via skos:related, there must not be a
+    chain of skos:broader relationships from A to B. The same holds of
+    skos:narrower.
+    Source: https://www.w3.org/TR/skos-primer/#secassociative"""
+    _ERR = "S27"
+    _REF = "https://www.w3.org/TR/skos-reference/#L2422"
+    _DEFAULT_MSG = "The transitive closure of skos:broader is disjoint from skos:related."
+
+class RedundantLabelError(_SKOSRuleError):
+    """There cannot be more than one preferred label per language."""
+    _ERR = "S14"
+    _REF = "https://www.w3.org/TR/skos-reference/#L1567"
+    _DEFAULT_MSG = "A concept cannot have more than one preferred label per language."
+
+#The example number, reference URL, and message used by ReflexiveError for
+# each predicate, so the error can be found with one lookup. The predicates
+# are plain strings so this module does not need rdflib. ReflexiveError looks
+# up str(predicate), which costs a string copy, but only while an error is
+# being raised.
+_SKOS = "http://www.w3.org/2004/02/skos/core#"
+
+_REFLEXIVE_DISPATCH = {
+    _SKOS + "related": ("E33",
+                        "https://www.w3.org/TR/skos-reference/#L2376",
+                        "If the irreflexive flag is true, then a concept cannot be related to itself."),
+    _SKOS + "broader": ("E36",
+                        "https://www.w3.org/TR/skos-reference/#L2449",
+                        "If the irreflexive flag is true, then a concept cannot be broader than itself."),
+    _SKOS + "narrower": ("E36",
+                         "https://www.w3.org/TR/skos-reference/#L2449",
+                         "If the irreflexive flag is true, then a concept cannot be narrower than itself."),
+    _SKOS + "broaderTransitive": ("E37",
+                                  "https://www.w3.org/TR/skos-reference/#L2484",
+                                  "If the irreflexive flag is true, then a concept cannot be broader (transitive) than itself."),
+    _SKOS + "narrowerTransitive": ("E37",
+                                   "https://www.w3.org/TR/skos-reference/#L2484",
+                                   "If the irreflexive flag is true, then a concept cannot be narrower (transitive) than itself."),
+    _SKOS + "broadMatch": ("E66",
+                           "https://www.w3.org/TR/skos-reference/#L4499",
+                           "If the irreflexive flag is true, then a concept cannot be a broad match of itself."),
+    _SKOS + "closeMatch": ("E66",
+                           "https://www.w3.org/TR/skos-reference/#L4499",
+                           "If the irreflexive flag is true, then a concept cannot be a close match of itself."),
+    _SKOS + "exactMatch": ("E66",
+                           "https://www.w3.org/TR/skos-reference/#L4499",
+                           "If the irreflexive flag is true, then a concept cannot be an exact match of itself."),
+    _SKOS + "narrowMatch": ("E66",
+                            "https://www.w3.org/TR/skos-reference/#L4499",
+                            "If the irreflexive flag is true, then a concept cannot be a narrow match of itself."),
+    _SKOS + "relatedMatch": ("E66",
+                             "https://www.w3.org/TR/skos-reference/#L4499",
+                             "If the irreflexive flag is true, then a concept cannot be a related match of itself.")
+    }
+
+class ReflexiveError(SKOSError):
+    """By default, SKOS allows reflexive triples. That means a concept can be
+    related to itself. This relationship is represented by a triple's subject
+    and object being the same URI. If the irreflexive flag is set to True on
+    method that adds a relationship, then a triple cannot have the same URI for
+    the subject and object. That is, you cannot create a relationship between a
+    concept and itself."""
+    def __init__(self, triple):
+        
+        predicate = triple[1]
+        
+        #URIRef only compares equal to other URIRefs, so look up the plain string
+        details = _REFLEXIVE_DISPATCH.get(str(predicate))
+        
+        if details is not None:
+            exampleNumber, referenceURL, message = details
+        else:
+            exampleNumber = "N/A"
+            referenceURL = "https://www.w3.org/TR/skos-reference/"
+            message = "If the irreflexive flag is true, then a concept cannot a subject and object with predicate, {}.".format(predicate)
+        
+        SKOSError.__init__(self, exampleNumber, referenceURL, triple, message)
+
+class InvalidPredicateError(_SKOSRuleError):
+    """Thrown when the wrong predicate is passed to the _addRelationships
+    method of a concept, which should never happen."""
+    _ERR = "N/A"
+    _REF = "N/A"
+
+class ImproperAssociationError(_SKOSRuleError):
+    """By convention, non-mapping relationships are expected to be asserted
+    between concepts that belong to the same concept schemes. But they are
+    implied by mapping relationships.
+    Source: https://www.w3.org/TR/skos-primer/#secmapping"""
+    _ERR = "N/A"
+    _REF = "https://www.w3.org/TR/skos-primer/#secmapping"
+
+class ImproperMappingError(_SKOSRuleError):
+    """By convention, mapping relationships are expected to be asserted between
+    concepts that belong to different concept schemes.
+    Source: https://www.w3.org/TR/skos-primer/#secmapping"""
+    _ERR = "N/A"
+    _REF = "https://www.w3.org/TR/skos-primer/#secmapping"
+
+class SchemeConceptError(_SKOSRuleError):
+    """Right now this is only thrown when the integrity condition in section
+    4.4 of the SKOS reference is violated:
+    https://www.w3.org/TR/skos-reference/#L1228"""
+    _ERR = "S9"
+    _REF = "https://www.w3.org/TR/skos-reference/#L1228"
+    _DEFAULT_MSG = "A concept cannot be a concept scheme, and a concept scheme cannot be a concept."
+        
+class TopConceptError(_SKOSRuleError):
+    """By convention, top concepts of a scheme should not have a broader
+    concept in the same scheme."""
+    _ERR = "E8"
+    _REF = "https://www.w3.org/TR/skos-reference/#L2446"
+    _DEFAULT_MSG = "By convention, top concepts of a scheme should not have a broader concept in the same scheme."
@@ -143,6 +143,60 @@ except skostools.DisjointMatchError:
 else:
     logger.info("Disjoint exact match test failed.")
 
+#Test adding several alternate labels at once
+altLabelTriples = test2.addAltLabels([("Test two", "en"), ("Second test", "en")])
+
+if [t[2] for t in altLabelTriples] == [skostools.PlainLiteral("Test two", "en"), skostools.PlainLiteral("Second test", "en")] and \
+    all(t in skostools.masterGraph for t in altLabelTriples):
+    logger.info("Alternate labels return value test passed.")
+else:
+    logger.info("Alternate labels return value test failed.")
+
+#Test that a conflicting label stops all of the labels from being added
+try:
+    test2.addAltLabels([("Test deux", "en"), ("Test 2", "en")])
+except skostools.ConflictingLabelError:
+    if (test2.uri, skostools.SKOS.altLabel, skostools.PlainLiteral("Test deux", "en")) in skostools.masterGraph:
+        logger.info("Conflicting alternate labels test failed.")
+    else:
+        logger.info("Conflicting alternate labels test passed.")
+else:
+    logger.info("Conflicting alternate labels test failed.")
+
+#Test that a label repeated within the new labels conflicts too
+try:
+    test2.addAltLabels([("Test II", "en"), ("Test II", "en")])
+except skostools.ConflictingLabelError:
+    logger.info("Repeated alternate labels test passed.")
+else:
+    logger.info("Repeated alternate labels test failed.")
+
+#Test adding several notes at once
+newNotes = test2.addNotes([("Inside Scheme A.", "en"), ("Second concept in scheme A.", "en")], skostools.SKOS.scopeNote)
+
+if newNotes == [skostools.PlainLiteral("Inside Scheme A.", "en"), skostools.PlainLiteral("Second concept in scheme A.", "en")] and \
+    set(newNotes) == set(skostools.masterGraph.objects(test2.uri, skostools.SKOS.scopeNote)):
+    logger.info("Notes return value test passed.")
+else:
+    logger.info("Notes return value test failed.")
+
+#Test that notes added with a predicate that is not a note predicate use skos:note
+fallbackNotes = test2.addNotes([("Not a label.", "en")], skostools.SKOS.prefLabel)
+
+if (test2.uri, skostools.SKOS.note, fallbackNotes[0]) in skostools.masterGraph and \
+    (test2.uri, skostools.SKOS.prefLabel, fallbackNotes[0]) not in skostools.masterGraph:
+    logger.info("Invalid note predicate test passed.")
+else:
+    logger.info("Invalid note predicate test failed.")
+
+#Test the query getAllTriples sends to SPARQL stores on an in-memory store
+queryTriples = set( tuple(row) for row in skostools.masterGraph.query(skostools._ALL_TRIPLES_QUERY % {'uri': test1.uri.n3()}) )
+
+if queryTriples == test1.getAllTriples():
+    logger.info("All triples query test passed.")
+else:
+    logger.info("All triples query test failed.")
+
 #Write graphs to files
 skostools.masterGraph.serialize(r'D:\Code Stuff\pythonProjects\skos\test\masterGraph.ttl', format='ttl')
 
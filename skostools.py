@@ -51,6 +51,22 @@ worth learning.
 
 import rdflib
 import logging
+import functools
+import itertools
+
+#The custom exceptions are defined in skoserrors so they can be used without
+# importing rdflib.
+from skoserrors import (SKOSError,
+                        ConflictingLabelError,
+                        DisjointMatchError,
+                        DisjointRelationError,
+                        RedundantLabelError,
+                        ReflexiveError,
+                        InvalidPredicateError,
+                        ImproperAssociationError,
+                        ImproperMappingError,
+                        SchemeConceptError,
+                        TopConceptError)
 
 # =============================================================================
 # Configure logging for the skostools module
@@ -75,298 +91,124 @@ logger.addHandler(logging.NullHandler())
 RDF = rdflib.namespace.RDF
 SKOS = rdflib.namespace.SKOS
 
-#Sets of URIs of SKOS properties (predicates)
-SKOSLabels = {SKOS.altLabel,
-              SKOS.hiddenLabel,
-              SKOS.prefLabel}
-
-SKOSNotes = {SKOS.definition,
-             SKOS.changeNote,
-             SKOS.editorialNote,
-             SKOS.example,
-             SKOS.historyNote,
-             SKOS.note,
-             SKOS.scopeNote}
-
-SKOSSemanticRelations = {SKOS.broader,
-                         SKOS.broaderTransitive,
-                         SKOS.narrower,
-                         SKOS.narrowerTransitive,
-                         SKOS.related}
-
-SKOSMappingRelations = {SKOS.broadMatch,
-                        SKOS.closeMatch,
-                        SKOS.exactMatch,
-                        SKOS.narrowMatch,
-                        SKOS.relatedMatch}
-
-SKOSSchemeRelations = {SKOS.inScheme,
-                       SKOS.hasTopConcept,
-                       SKOS.topConceptOf}
-
-SKOSCollections = {SKOS.Collection,
-                   SKOS.member,
-                   SKOS.OrderedCollection,
-                   SKOS.memberList}
-
-SKOSPredicates = SKOSLabels.union(SKOSNotes,
-                                  SKOSSemanticRelations,
-                                  SKOSMappingRelations,
-                                  SKOSSchemeRelations,
-                                  SKOSCollections)
-
-SKOSPredicates.add(SKOS.notation)
-
-# =============================================================================
-# Custom Exceptions
-# =============================================================================
-
-class SKOSError(Exception):
-    """Serves as base class for other custom errors. Do not use directly."""
-    
-    def __init__(self, exampleNumber, referenceURL, triple, message=None):
-        """
-        SKOS errors are raised when a user tries to add a triple that would violate the SKOS standard.
-
-        Parameters
-        ----------
-        triple : 3-tuple, optional
-            The triple the user attempted to add to masterGraph. The default is None.
-        exampleNumber : str, optional
-            The error number corresponds to the example number in the SKOS reference. The default is None.
-        referenceURL : str, optional
-            The URL of the SKOS refrence section which describes the violation that threw the exception. The default is None.
+#Looking up an attribute of a namespace is slow compared to reading a
+# variable, so the URIs used in this module are looked up once here.
+_RDF_TYPE = RDF.type
+
+_SKOS_CONCEPT = SKOS.Concept
+_SKOS_CONCEPT_SCHEME = SKOS.ConceptScheme
+_SKOS_COLLECTION = SKOS.Collection
+_SKOS_ORDERED_COLLECTION = SKOS.OrderedCollection
+
+_SKOS_ALT_LABEL = SKOS.altLabel
+_SKOS_HIDDEN_LABEL = SKOS.hiddenLabel
+_SKOS_PREF_LABEL = SKOS.prefLabel
+_SKOS_NOTATION = SKOS.notation
+
+_SKOS_DEFINITION = SKOS.definition
+_SKOS_CHANGE_NOTE = SKOS.changeNote
+_SKOS_EDITORIAL_NOTE = SKOS.editorialNote
+_SKOS_EXAMPLE = SKOS.example
+_SKOS_HISTORY_NOTE = SKOS.historyNote
+_SKOS_NOTE = SKOS.note
+_SKOS_SCOPE_NOTE = SKOS.scopeNote
+
+_SKOS_BROADER = SKOS.broader
+_SKOS_BROADER_TRANSITIVE = SKOS.broaderTransitive
+_SKOS_NARROWER = SKOS.narrower
+_SKOS_NARROWER_TRANSITIVE = SKOS.narrowerTransitive
+_SKOS_RELATED = SKOS.related
+
+_SKOS_BROAD_MATCH = SKOS.broadMatch
+_SKOS_CLOSE_MATCH = SKOS.closeMatch
+_SKOS_EXACT_MATCH = SKOS.exactMatch
+_SKOS_NARROW_MATCH = SKOS.narrowMatch
+_SKOS_RELATED_MATCH = SKOS.relatedMatch
+
+_SKOS_IN_SCHEME = SKOS.inScheme
+_SKOS_HAS_TOP_CONCEPT = SKOS.hasTopConcept
+_SKOS_TOP_CONCEPT_OF = SKOS.topConceptOf
+
+_SKOS_MEMBER = SKOS.member
+_SKOS_MEMBER_LIST = SKOS.memberList
 
-        Returns
-        -------
-        None.
-
-        """
-        self.err = exampleNumber
-        
-        self.ref = referenceURL
-        
-        self.tpl = triple
-        
-        self.msg = "Triple {} violates example {} from {}.".format(self.tpl, self.err, self.ref)
-        
-        if message != None:
-            self.msg = ' '.join([self.msg, message])
-        
-        super().__init__(self.msg)
-
-class ConflictingLabelError(SKOSError):
-    """It is an error if a concept has the same literal both as its preferred
-    label and as an alternative label or hidden label.
-    Source: https://www.w3.org/TR/skos-primer/#seclabel"""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "S13",
-                           "https://www.w3.org/TR/skos-reference/#L1567",
-                           triple,
-                           "A concept cannot have the same plain literal for two or more different label types.")
-
-class DisjointMatchError(SKOSError):
-    """By convention, mapping relationships are expected to be asserted between
-    concepts that belong to different concept schemes.
-    Source: https://www.w3.org/TR/skos-primer/#secmapping"""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "S46",
-                           "https://www.w3.org/TR/skos-reference/#L5429",
-                           triple,
-                           "skos:exactMatch is disjoint with skos:broadMatch, skos:narrowMatch, and skos:relatedMatch.")
-
-class DisjointRelationError(SKOSError):
-    """The transitive closure of skos:broader is disjoint from skos:related.
-    If resources A and B are related via skos:related, there must not be a
-    chain of skos:broader relationships from A to B. The same holds of
-    skos:narrower.
-    Source: https://www.w3.org/TR/skos-primer/#secassociative"""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "S27",
-                           "https://www.w3.org/TR/skos-reference/#L2422",
-                           triple,
-                           "The transitive closure of skos:broader is disjoint from skos:related.")
-
-class RedundantLabelError(SKOSError):
-    """There cannot be more than one preferred label per language."""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "S14",
-                           "https://www.w3.org/TR/skos-reference/#L1567",
-                           triple,
-                           "A concept cannot have more than one preferred label per language.")
-
-class ReflexiveError(SKOSError):
-    """By default, SKOS allows reflexive triples. That means a concept can be
-    related to itself. This relationship is represented by a triple's subject
-    and object being the same URI. If the irreflexive flag is set to True on
-    method that adds a relationship, then a triple cannot have the same URI for
-    the subject and object. That is, you cannot create a relationship between a
-    concept and itself."""
-    def __init__(self, triple):
-        
-        predicate = triple[1]
-        
-        if predicate == SKOS.related:
-            SKOSError.__init__(self,
-                               "E33",
-                               "https://www.w3.org/TR/skos-reference/#L2376",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be related to itself.")
-        elif predicate == SKOS.broader:
-            SKOSError.__init__(self,
-                               "E36",
-                               "https://www.w3.org/TR/skos-reference/#L2449",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be broader than itself.")
-        elif predicate == SKOS.narrower:
-            SKOSError.__init__(self,
-                               "E36",
-                               "https://www.w3.org/TR/skos-reference/#L2449",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be narrower than itself.")
-        elif predicate == SKOS.broaderTransitive:
-            SKOSError.__init__(self,
-                               "E37",
-                               "https://www.w3.org/TR/skos-reference/#L2484",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be broader (transitive) than itself.")
-        elif predicate == SKOS.narrowerTransitive:
-            SKOSError.__init__(self,
-                               "E37",
-                               "https://www.w3.org/TR/skos-reference/#L2484",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be narrower (transitive) than itself.")
-        elif predicate == SKOS.broadMatch:
-            SKOSError.__init__(self,
-                               "E66",
-                               "https://www.w3.org/TR/skos-reference/#L4499",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be a broad match of itself.")
-        elif predicate == SKOS.closeMatch:
-            SKOSError.__init__(self,
-                               "E66",
-                               "https://www.w3.org/TR/skos-reference/#L4499",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be a close match of itself.")
-        elif predicate == SKOS.exactMatch:
-            SKOSError.__init__(self,
-                               "E66",
-                               "https://www.w3.org/TR/skos-reference/#L4499",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be an exact match of itself.")
-        elif predicate == SKOS.narrowMatch:
-            SKOSError.__init__(self,
-                               "E66",
-                               "https://www.w3.org/TR/skos-reference/#L4499",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be a narrow match of itself.")
-        elif predicate == SKOS.relatedMatch:
-            SKOSError.__init__(self,
-                               "E66",
-                               "https://www.w3.org/TR/skos-reference/#L4499",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot be a related match of itself.")
-        else:
-            SKOSError.__init__(self,
-                               "N/A",
-                               "https://www.w3.org/TR/skos-reference/",
-                               triple,
-                               "If the irreflexive flag is true, then a concept cannot a subject and object with predicate, {}.".format(predicate))
-
-class InvalidPredicateError(SKOSError):
-    """Thrown when the wrong predicate is passed to the _addRelationships
-    method of a concept, which should never happen."""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "N/A",
-                           "N/A",
-                           triple)
-
-class ImproperAssociationError(SKOSError):
-    """By convention, non-mapping relationships are expected to be asserted
-    between concepts that belong to the same concept schemes. But they are
-    implied by mapping relationships.
-    Source: https://www.w3.org/TR/skos-primer/#secmapping"""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "N/A",
-                           "https://www.w3.org/TR/skos-primer/#secmapping",
-                           triple)
-
-class ImproperMappingError(SKOSError):
-    """By convention, mapping relationships are expected to be asserted between
-    concepts that belong to different concept schemes.
-    Source: https://www.w3.org/TR/skos-primer/#secmapping"""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "N/A",
-                           "https://www.w3.org/TR/skos-primer/#secmapping",
-                           triple)
-
-class SchemeConceptError(SKOSError):
-    """Right now this is only thrown when the integrity condition in section
-    4.4 of the SKOS reference is violated:
-    https://www.w3.org/TR/skos-reference/#L1228"""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "S9",
-                           "https://www.w3.org/TR/skos-reference/#L1228",
-                           triple,
-                           "A concept cannot be a concept scheme, and a concept scheme cannot be a concept.")
-        
-class TopConceptError(SKOSError):
-    """By convention, top concepts of a scheme should not have a broader
-    concept in the same scheme."""
-    def __init__(self, triple):
-        
-        SKOSError.__init__(self,
-                           "E8",
-                           "https://www.w3.org/TR/skos-reference/#L2446",
-                           triple,
-                           "By convention, top concepts of a scheme should not have a broader concept in the same scheme.")
+#Sets of URIs of SKOS properties (predicates)
+#These sets never change, so they are frozen
+SKOSLabels = frozenset({_SKOS_ALT_LABEL,
+                        _SKOS_HIDDEN_LABEL,
+                        _SKOS_PREF_LABEL})
+
+SKOSNotes = frozenset({_SKOS_DEFINITION,
+                       _SKOS_CHANGE_NOTE,
+                       _SKOS_EDITORIAL_NOTE,
+                       _SKOS_EXAMPLE,
+                       _SKOS_HISTORY_NOTE,
+                       _SKOS_NOTE,
+                       _SKOS_SCOPE_NOTE})
+
+SKOSSemanticRelations = frozenset({_SKOS_BROADER,
+                                   _SKOS_BROADER_TRANSITIVE,
+                                   _SKOS_NARROWER,
+                                   _SKOS_NARROWER_TRANSITIVE,
+                                   _SKOS_RELATED})
+
+SKOSMappingRelations = frozenset({_SKOS_BROAD_MATCH,
+                                  _SKOS_CLOSE_MATCH,
+                                  _SKOS_EXACT_MATCH,
+                                  _SKOS_NARROW_MATCH,
+                                  _SKOS_RELATED_MATCH})
+
+SKOSSchemeRelations = frozenset({_SKOS_IN_SCHEME,
+                                 _SKOS_HAS_TOP_CONCEPT,
+                                 _SKOS_TOP_CONCEPT_OF})
+
+SKOSCollections = frozenset({_SKOS_COLLECTION,
+                             _SKOS_MEMBER,
+                             _SKOS_ORDERED_COLLECTION,
+                             _SKOS_MEMBER_LIST})
+
+SKOSPredicates = frozenset(SKOSLabels | SKOSNotes | SKOSSemanticRelations |
+                           SKOSMappingRelations | SKOSSchemeRelations |
+                           SKOSCollections | {_SKOS_NOTATION})
+
+#The inverse of each semantic and mapping relation
+_INVERSE = {_SKOS_BROADER: _SKOS_NARROWER,
+            _SKOS_NARROWER: _SKOS_BROADER,
+            _SKOS_RELATED: _SKOS_RELATED,
+            _SKOS_BROAD_MATCH: _SKOS_NARROW_MATCH,
+            _SKOS_NARROW_MATCH: _SKOS_BROAD_MATCH,
+            _SKOS_CLOSE_MATCH: _SKOS_CLOSE_MATCH,
+            _SKOS_EXACT_MATCH: _SKOS_EXACT_MATCH,
+            _SKOS_RELATED_MATCH: _SKOS_RELATED_MATCH}
+
+#The checks Concept._relate makes before adding each relation. Each value is
+# (inSchemeRequired, schemeError, disjointRules). schemeError is raised unless
+# the concepts sharing a scheme is inSchemeRequired. Each disjoint rule is
+# (predicate, error, eitherDirection), and error is raised if predicate already
+# relates the concepts (in either direction if eitherDirection is True,
+# otherwise only from this concept to the other).
+_RELATIONSHIP_RULES = {
+    _SKOS_BROADER: (True, ImproperAssociationError,
+                    ((_SKOS_RELATED, DisjointRelationError, True),)),
+    _SKOS_NARROWER: (True, ImproperAssociationError,
+                     ((_SKOS_RELATED, DisjointRelationError, True),)),
+    _SKOS_RELATED: (True, ImproperMappingError, ()),
+    _SKOS_BROAD_MATCH: (False, ImproperMappingError,
+                        ((_SKOS_RELATED_MATCH, DisjointRelationError, True),
+                         (_SKOS_EXACT_MATCH, DisjointMatchError, True))),
+    _SKOS_NARROW_MATCH: (False, ImproperMappingError, ()),
+    _SKOS_CLOSE_MATCH: (False, ImproperMappingError, ()),
+    _SKOS_EXACT_MATCH: (False, ImproperMappingError,
+                        ((_SKOS_BROAD_MATCH, DisjointMatchError, False),
+                         (_SKOS_NARROW_MATCH, DisjointMatchError, False),
+                         (_SKOS_RELATED_MATCH, DisjointMatchError, False))),
+    _SKOS_RELATED_MATCH: (False, ImproperMappingError, ())
+    }
 
 # =============================================================================
 # Helper functions (functions intended for use inside the module)
 # =============================================================================
 
-def _checkType(theObject, theType):
-    """
-    Checks that theObject is an instance of theType.
-
-    Parameters
-    ----------
-    theObject : object
-        Any Python object.
-    theType : a type
-        Any Python type including custom classes.
-
-    Raises
-    ------
-    TypeError
-        A type error is raised if theObject is not an instance of theType.
-
-    Returns
-    -------
-    None.
-
-    """
-    if not isinstance(theObject, theType):
-        raise TypeError
-        
-    return True
-
 def _cleanUpPlainLiteral(literal, lang):
     """
     An internal function used to convert strings to RDF plain literals
@@ -389,17 +231,60 @@ def _cleanUpPlainLiteral(literal, lang):
         and language of input variable lang (if not already defined).
 
     """
-    if isinstance(literal, str):
-        newLiteral = PlainLiteral(literal, lang)
-    elif isinstance(literal, rdflib.term.Literal) or isinstance(literal, PlainLiteral):
-        if literal.language == None and lang != None:
-            newLiteral = PlainLiteral(str(literal), lang)
-        else:
-            newLiteral = PlainLiteral(str(literal), literal.language)
-    else:
+    #Exact str objects (the common case) get a cached plain literal.
+    if type(literal) is str:
+        return _cachedPlainLiteral(literal, lang)
+    
+    #A plain literal that already has the right language (or any language,
+    # if lang is None) is returned as is.
+    if type(literal) is PlainLiteral and \
+        (lang is None or literal.language == lang):
+        return literal
+    
+    #Anything else must be a string. rdflib literals are strings too, so this
+    # covers them and str subclasses. If lang is None, rdflib keeps the
+    # language of a literal that already has one.
+    if not isinstance(literal, str):
         raise TypeError
-        
-    return newLiteral
+    
+    return PlainLiteral(literal, lang)
+
+#Labels and notes often repeat the same strings and language tags, and plain
+# literals are immutable, so the plain literals made from str objects are
+# cached.
+@functools.lru_cache(maxsize=8192)
+def _cachedPlainLiteral(lexical, lang):
+    
+    return PlainLiteral(lexical, lang)
+
+def _cleanUpNote(note, lang):
+    """
+    An internal function used to convert the notes passed to Concept.addNote
+    and Concept.addNotes into the objects of note triples.
+
+    Parameters
+    ----------
+    note : PlainLiteral, rdflib.term.Literal, str, rdflib.term.URIRef, rdflib.term.BNode
+        The documentation note.
+    lang : str
+        The language code used for the note. Can be None.
+
+    Returns
+    -------
+    newNote : PlainLiteral
+        If note was a string or literal, then newNote is the PlainLiteral
+        created from note & lang. If note was a blank node or URI reference,
+        then newNote is note.
+
+    """
+    if isinstance(note, str) or isinstance(note, rdflib.term.Literal):
+        newNote = _cleanUpPlainLiteral(note, lang)
+    elif isinstance(note, rdflib.term.BNode) or isinstance(note, rdflib.term.URIRef):
+        newNote = note
+    else:
+        newNote = PlainLiteral(str(note), lang)
+    
+    return newNote
 
 def easyURI(thing):
     """
@@ -421,16 +306,65 @@ def easyURI(thing):
         The URI reference obtained from thing.
 
     """
-    if isinstance(thing, SKOSSubject):
-        thingURI = thing.uri
-    elif isinstance(thing, rdflib.term.URIRef):
-        thingURI = thing
-    elif isinstance(thing, str):
-        thingURI = rdflib.term.URIRef(thing)
+    getURI = _uriGetters.get(type(thing))
+    
+    if getURI is None:
+        getURI = _findURIGetter(type(thing))
+    
+    return getURI(thing)
+
+#Functions that get a URI from each type accepted by easyURI, keyed by type.
+# Types that are not in the dictionary yet are added by _findURIGetter.
+_uriGetters = {}
+
+def _findURIGetter(thingType):
+    """
+    Find the function easyURI uses to get a URI from thingType and remember
+    it for later calls.
+
+    Parameters
+    ----------
+    thingType : type
+        The type of the variable passed to easyURI.
+
+    Raises
+    ------
+    ValueError
+        If thingType is not a SKOSSubject, URIRef, or string type.
+
+    Returns
+    -------
+    getURI : function
+        A function that takes an instance of thingType and returns its URI.
+
+    """
+    if issubclass(thingType, SKOSSubject):
+        getURI = _subjectURI
+    elif issubclass(thingType, rdflib.term.URIRef):
+        getURI = _sameURI
+    elif thingType is str:
+        getURI = _cachedURIRef
+    elif issubclass(thingType, str):
+        getURI = rdflib.term.URIRef
     else:
         raise ValueError
     
-    return thingURI
+    _uriGetters[thingType] = getURI
+    
+    return getURI
+
+def _subjectURI(thing):
+    
+    return thing.uri
+
+def _sameURI(thing):
+    
+    return thing
+
+#The same URI strings tend to be passed over and over (to relate concepts, for
+# example), and URIRefs are immutable, so the URIRefs made from plain strings
+# are cached.
+_cachedURIRef = functools.lru_cache(maxsize=4096)(rdflib.term.URIRef)
 
 # =============================================================================
 # Class definitions
@@ -445,7 +379,21 @@ class SKOSGraph(rdflib.graph.Graph):
         
         self.bind('skos', SKOS, override=False)
         
-        logger.debug("Graph with identifier {} was created.".format(self.identifier))
+        logger.debug("Graph with identifier %s was created.", self.identifier)
+
+#Used by SKOSSubject.getAllTriples when the graph is stored behind a SPARQL
+# endpoint. It matches the triples with the subject's URI as the subject or as
+# the object.
+_ALL_TRIPLES_QUERY = """SELECT ?s ?p ?o WHERE {
+    { %(uri)s ?p ?o BIND(%(uri)s AS ?s) }
+    UNION
+    { ?s ?p %(uri)s BIND(%(uri)s AS ?o) }
+}"""
+
+def _isSPARQLStore(store):
+    #Checks the class names so that importing skostools does not load rdflib's
+    # SPARQL store plugin. SPARQLUpdateStore is a subclass, so it matches too.
+    return any(cls.__name__ == 'SPARQLStore' for cls in type(store).__mro__)
 
 # =============================================================================
 # Define the masterGraph. The masterGraph will store all of the triples of all
@@ -464,17 +412,25 @@ class PlainLiteral(rdflib.term.Literal):
     
     def __new__(cls, lexical, lang=None, normalize=None):
         
-        _checkType(lexical, str)
+        if not isinstance(lexical, str):
+            raise TypeError
         
         return super().__new__(cls, lexical, lang, None, normalize)
 
 class SKOSSubject(object):
     
-    def __init__(self, URI):
+    #A SKOS subject only stores its graph and URI; everything else is in the
+    # graph. Slots keep large vocabularies from carrying a __dict__ for each
+    # subject. Subclasses declare empty slots to keep it that way.
+    __slots__ = ('graph', 'uri')
+    
+    #Every SKOS subject is stored in masterGraph unless it is given a graph.
+    # Subjects in separate graphs do not share any state.
+    def __init__(self, URI, graph=None):
         
         global masterGraph
         
-        self.graph = masterGraph
+        self.graph = masterGraph if graph is None else graph
         
         if isinstance(URI, rdflib.URIRef):
             self.uri = URI
@@ -504,10 +460,42 @@ class SKOSSubject(object):
         """
         self.graph.add(triple)
         
-        logger.debug("Triple, {}, added to graph, {}.".format(triple, self.graph.identifier))
+        logger.debug("Triple, %s, added to graph, %s.", triple, self.graph.identifier)
         
         return triple
     
+    def _addType(self, triple, conflictingTypes):
+        """
+        Adds the rdf:type triple of a concept, concept scheme, or collection
+        unless the subject already has one of the conflicting types.
+
+        Parameters
+        ----------
+        triple : 3-tuple
+            The rdf:type triple to add, where self.uri is the subject.
+        conflictingTypes : tuple
+            The SKOS classes the subject cannot also be an instance of.
+
+        Raises
+        ------
+        SchemeConceptError
+            If the subject already has one of the conflicting types.
+
+        Returns
+        -------
+        triple : 3-tuple
+            The triple passed to the function.
+
+        """
+        #One lookup gets all of the subject's types, instead of one lookup per
+        # conflicting type.
+        existingTypes = set( self.graph.objects(self.uri, _RDF_TYPE) )
+        
+        if not existingTypes.isdisjoint(conflictingTypes):
+            raise SchemeConceptError(triple)
+        
+        return self._addTriple(triple)
+    
     def _easyTriple(self, SKOSobject, predicate):
         """
         A private function that gets a URI from the argument added to the 
@@ -543,10 +531,17 @@ class SKOSSubject(object):
             A set of all triples concerning self.uri.
 
         """
+        if _isSPARQLStore(self.graph.store) and \
+            isinstance(self.uri, rdflib.term.URIRef):
+            #A remote store answers both triple patterns in one round trip
+            query = _ALL_TRIPLES_QUERY % {'uri': self.uri.n3()}
+            return set( tuple(row) for row in self.graph.query(query) )
 
         outputSet = set( self.graph.triples( (self.uri, None, None) ) )
-            
-        outputSet = outputSet.union( set( self.graph.triples( (None, None, self.uri) ) ) )
+        
+        #Adding the second lookup straight into the set avoids building a
+        # second set and a copy for the union.
+        outputSet.update( self.graph.triples( (None, None, self.uri) ) )
             
         return outputSet
         
@@ -567,12 +562,14 @@ class SKOSSubject(object):
         """
         updatedURI = easyURI(newURI)
         
+        #Removing and re-adding every triple would leave the graph unchanged
+        if updatedURI == self.uri:
+            return updatedURI
+        
         allTriples = self.getAllTriples()
         
         for triple in allTriples:
-            subject = triple[0]
-            predicate = triple[1]
-            RDFobject = triple[2]
+            subject, predicate, RDFobject = triple
             if subject == self.uri:
                 subject = updatedURI
             if RDFobject == self.uri:
@@ -606,20 +603,15 @@ class Concept(SKOSSubject):
     Predicates support more than one object in relation to the subject, so
     the OBJECTS are stored in a set."""
     
-    def __init__(self, URI):
-        
-        SKOSSubject.__init__(self, URI)
-        
-        triple = (self.uri, RDF.type, SKOS.Concept)
+    __slots__ = ()
+    
+    def __init__(self, URI, graph=None):
         
-        notAConceptScheme = (self.uri, RDF.type, SKOS.ConceptScheme) not in self.graph
+        SKOSSubject.__init__(self, URI, graph)
         
-        notACollection = (self.uri, RDF.type, SKOS.Collection) not in self.graph
+        triple = (self.uri, _RDF_TYPE, _SKOS_CONCEPT)
         
-        if notAConceptScheme and notACollection:
-            self._addTriple( triple )
-        else:
-            raise SchemeConceptError(triple)
+        self._addType(triple, (_SKOS_CONCEPT_SCHEME, _SKOS_COLLECTION))
 
     def _addLabel(self, predicate, literal, lang):
         """
@@ -644,11 +636,12 @@ class Concept(SKOSSubject):
         
         triple = (self.uri, predicate, newLiteral)
         
-        for label in SKOSLabels:
-            for RDFObject in self.graph.objects(self.uri, label):
-                if RDFObject == newLiteral:
-                    #A literal cannot be the object of more than one label predicate. In other words, you can't have the same string as hidden label and an alternate label.
-                    raise ConflictingLabelError(triple)
+        #Only the predicates that already link this concept to newLiteral are
+        # looked up, instead of every label of every type.
+        for RDFPredicate in self.graph.predicates(self.uri, newLiteral):
+            if RDFPredicate in SKOSLabels:
+                #A literal cannot be the object of more than one label predicate. In other words, you can't have the same string as hidden label and an alternate label.
+                raise ConflictingLabelError(triple)
         
         return self._addTriple(triple)
     
@@ -691,14 +684,103 @@ class Concept(SKOSSubject):
         """
         return self.graph.objects(self.uri, predicate)
     
+    def _hasRelationship(self, conceptURI, predicate):
+        """
+        Private function to test if predicate relates this concept and the concept with URI conceptURI, in either direction.
+
+        Parameters
+        ----------
+        conceptURI : rdflib.term.URIref
+            The URI of the other concept.
+        predicate : rdflib.term.URIref
+            A skos property.
+
+        Returns
+        -------
+        hasRelationship : bool
+            True if either (self.uri, predicate, conceptURI) or (conceptURI, predicate, self.uri) is in the graph.
+
+        """
+        return (self.uri, predicate, conceptURI) in self.graph or \
+            (conceptURI, predicate, self.uri) in self.graph
+    
+    def _relate(self, concept, predicate, irreflexive):
+        """
+        Private function that adds a semantic or mapping relationship (and its inverse) after making the checks listed for predicate in _RELATIONSHIP_RULES.
+
+        Parameters
+        ----------
+        concept : Concept, rdflib.term.URIref, str
+            The object of the relationship.
+        predicate : rdflib.term.URIref
+            A key of _RELATIONSHIP_RULES.
+        irreflexive : bool
+            Setting this variable to True prevents self-reference.
+
+        Returns
+        -------
+        triple : 3-tuple
+            The triple created by this method.
+        """
+        inSchemeRequired, schemeError, disjointRules = _RELATIONSHIP_RULES[predicate]
+        
+        conceptURI, triple = self._easyTriple(concept, predicate)
+        
+        self._testReflexive(triple, irreflexive)
+        
+        if self._testSameScheme(concept) != inSchemeRequired:
+            raise schemeError(triple)
+        
+        for disjointPredicate, disjointError, eitherDirection in disjointRules:
+            if eitherDirection:
+                isDisjoint = self._hasRelationship(conceptURI, disjointPredicate)
+            else:
+                isDisjoint = (self.uri, disjointPredicate, conceptURI) in self.graph
+            if isDisjoint:
+                raise disjointError(triple)
+        
+        self._addRelationship(triple, (conceptURI, _INVERSE[predicate], self.uri) )
+        
+        return triple
+    
+    def _unrelate(self, concept, predicate):
+        """
+        Private function that removes a semantic or mapping relationship and its inverse.
+
+        Parameters
+        ----------
+        concept : Concept, rdflib.term.URIref, str
+            The object of the relationship.
+        predicate : rdflib.term.URIref
+            A key of _INVERSE.
+
+        Returns
+        -------
+        conceptURI : rdflib.term.URIref
+            The URI of the other concept.
+        triple : 3-tuple
+            The triple removed by this method.
+        """
+        conceptURI, triple = self._easyTriple(concept, predicate)
+        
+        self.graph.remove(triple)
+        
+        self.graph.remove( (conceptURI, _INVERSE[predicate], self.uri) )
+        
+        return conceptURI, triple
+    
     def _testReflexive(self, triple, raiseException):
         """Private function to check for reflexive statements."""
-        if (triple[0] == triple[2]):
+        subject, predicate, RDFobject = triple
+        
+        #The identity test is a quick answer for the common case where both
+        # ends are the same URIRef object.
+        if subject is RDFobject or subject == RDFobject:
             if raiseException:
                 #Preventing self-reference is a personal choice, not part of the SKOS model.
                 raise ReflexiveError(triple)
             else:
-                logger.warning("Reflexive triple added: {}".format(triple))
+                logger.warning("Reflexive triple added: %s", triple)
                 
     def _testSameScheme(self, concept):
         """
@@ -706,7 +788,7 @@ class Concept(SKOSSubject):
 
         Parameters
         ----------
-        concept : Concept
+        concept : Concept, rdflib.term.URIref, str
             Concept that is being related to this concept.
 
         Returns
@@ -715,11 +797,12 @@ class Concept(SKOSSubject):
             True if concepts share one scheme. False if concepts share no schemes.
 
         """
-        selfSchemes = set( self.getConceptSchemes() )
-        
-        conceptSchemes = set( concept.getConceptSchemes() )
+        conceptURI = easyURI(concept)
         
-        inSameScheme = not selfSchemes.isdisjoint(conceptSchemes)
+        #Each of this concept's schemes is checked with one triple lookup,
+        # stopping at the first scheme the concepts share.
+        inSameScheme = any( (conceptURI, _SKOS_IN_SCHEME, scheme) in self.graph
+                            for scheme in self.getConceptSchemes() )
         
         return inSameScheme
 
@@ -739,7 +822,47 @@ class Concept(SKOSSubject):
         triple : 3-tuple
             The triple that represents the label.
         """
-        return self._addLabel(SKOS.altLabel, literal, lang)
+        return self._addLabel(_SKOS_ALT_LABEL, literal, lang)
+    
+    def addAltLabels(self, labels):
+        """
+        Adds several alternate labels for the concept. The concept's existing labels are looked up once for all of the new labels, and no label is added unless all of them can be.
+
+        Parameters
+        ----------
+        labels : iterable of 2-tuples
+            (literal, lang) pairs, where literal and lang are the same as the arguments of addAltLabel.
+
+        Raises
+        ------
+        ConflictingLabelError
+            If one of the labels is already a label of the concept or appears twice in labels.
+
+        Returns
+        -------
+        triples : list
+            The triples that represent the labels.
+        """
+        existingLabels = set()
+        
+        for label in SKOSLabels:
+            existingLabels.update( self.graph.objects(self.uri, label) )
+        
+        triples = []
+        
+        for literal, lang in labels:
+            newLiteral = _cleanUpPlainLiteral(literal, lang)
+            triple = (self.uri, _SKOS_ALT_LABEL, newLiteral)
+            if newLiteral in existingLabels:
+                #A literal cannot be the object of more than one label predicate.
+                raise ConflictingLabelError(triple)
+            existingLabels.add(newLiteral)
+            triples.append(triple)
+        
+        for triple in triples:
+            self._addTriple(triple)
+        
+        return triples
         
     def addBroader(self, concept, irreflexive=False):
         """
@@ -757,22 +880,7 @@ class Concept(SKOSSubject):
         triple : 3-tuple
             The triple created by this method.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.broader)
-                
-        self._testReflexive(triple, irreflexive)
-                          
-        inSameScheme = self._testSameScheme(concept)
-        
-        if inSameScheme == False:
-            raise ImproperAssociationError(triple)
-            
-        if (self.uri, SKOS.related, conceptURI) in self.graph or \
-            (conceptURI, SKOS.related, self.uri) in self.graph:
-            raise DisjointRelationError(triple)
-            
-        self._addRelationship(triple, (conceptURI, SKOS.narrower, self.uri) )
-        
-        return triple
+        return self._relate(concept, _SKOS_BROADER, irreflexive)
     
     def addBroaderTransitive(self, concept, irreflexive=False):
         #TODO: implement this
@@ -795,27 +903,8 @@ class Concept(SKOSSubject):
         triple : 3-tuple
             The triple created by this method.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.broadMatch)
-                
-        self._testReflexive(triple, True)
-                          
-        inSameScheme = self._testSameScheme(concept)
-        
-        if inSameScheme == True:
-            raise ImproperMappingError(triple)
-            
-        if (self.uri, SKOS.relatedMatch, conceptURI) in self.graph or \
-            (conceptURI, SKOS.relatedMatch, self.uri) in self.graph:
-            raise DisjointRelationError(triple)
-            
-        if (self.uri, SKOS.exactMatch, conceptURI) in self.graph or \
-            (conceptURI, SKOS.exactMatch, self.uri) in self.graph:
-            raise DisjointMatchError(triple)
-            
-        self._addRelationship(triple, (conceptURI, SKOS.narrowMatch, self.uri) )
-            
-        return triple
-        
+        return self._relate(concept, _SKOS_BROAD_MATCH, True)
+    
     def addChangeNote(self, note, lang=None):
         """
         Adds a change note triple. Change notes typically are, but do not have to be, plain literals. They can also be blank nodes or URIs of other documents. Source: https://www.w3.org/TR/skos-primer/#secadvanceddocumentation
@@ -833,7 +922,7 @@ class Concept(SKOSSubject):
             If note was a string or literal, then newNote is the PlainLiteral created from note & lang. If note was a blank node or URI reference, then newNote is note.
 
         """
-        return self.addNote(note, lang, SKOS.changeNote)
+        return self.addNote(note, lang, _SKOS_CHANGE_NOTE)
         
     def addCloseMatch(self, concept):
         """
@@ -849,18 +938,7 @@ class Concept(SKOSSubject):
         triple : 3-tuple
             The triple created by this method.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.closeMatch)
-                
-        self._testReflexive(triple, True)
-                          
-        inSameScheme = self._testSameScheme(concept)
-        
-        if inSameScheme == True:
-            raise ImproperMappingError(triple)
-            
-        self._addRelationship(triple, (conceptURI, SKOS.closeMatch, self.uri) )
-            
-        return triple
+        return self._relate(concept, _SKOS_CLOSE_MATCH, True)
     
     def addDefinition(self, note, lang=None):
         """
@@ -879,7 +957,7 @@ class Concept(SKOSSubject):
             If note was a string or literal, then newNote is the PlainLiteral created from note & lang. If note was a blank node or URI reference, then newNote is note.
 
         """
-        return self.addNote(note, lang, SKOS.definition)
+        return self.addNote(note, lang, _SKOS_DEFINITION)
     
     def addEditorialNote(self, note, lang=None):
         """
@@ -898,7 +976,7 @@ class Concept(SKOSSubject):
             If note was a string or literal, then newNote is the PlainLiteral created from note & lang. If note was a blank node or URI reference, then newNote is note.
 
         """
-        return self.addNote(note, lang, SKOS.editorialNote)
+        return self.addNote(note, lang, _SKOS_EDITORIAL_NOTE)
         
     def addExactMatch(self, concept):
         """
@@ -915,25 +993,9 @@ class Concept(SKOSSubject):
             The triple created by this method.
         """
         #"The property skos:exactMatch is used to link two concepts, indicating a high degree of confidence that the concepts can be used interchangeably across a wide range of information retrieval applications. skos:exactMatch is a transitive property, and is a sub-property of skos:closeMatch." from https://www.w3.org/TR/skos-reference/#mapping
-        conceptURI, triple = self._easyTriple(concept, SKOS.exactMatch)
-                
-        self._testReflexive(triple, True)
-                          
-        inSameScheme = self._testSameScheme(concept)
-        
-        if inSameScheme == True:
-            raise ImproperMappingError(triple)
-        
-        BMset = set( self.getBroadMatches() )
-        
-        NMset = set( self.getNarrowMatches() )
+        triple = self._relate(concept, _SKOS_EXACT_MATCH, True)
         
-        RMset = set( self.getRelatedMatches() )
-        
-        if conceptURI in BMset.union(NMset, RMset):
-            raise DisjointMatchError(triple)
-        
-        self._addRelationship(triple, (conceptURI, SKOS.exactMatch, self.uri) )
+        conceptURI = triple[2]
         
         self.addCloseMatch(concept)
         
@@ -941,14 +1003,14 @@ class Concept(SKOSSubject):
         # 1) I am trying to add duplicate triples (the graph object should ignore these; it works like a set).
         # 2) I am ignoring the possibility of in-scheme relationships here, but elsewhere in the code I am preventing them.
         # This is the only transitive property I have tried to implement, so if I find a good way to do it, then I should try implementing broaderTransitive and narrowerTransitive as well.
-        for match in self.graph.objects(conceptURI, SKOS.exactMatch):
+        for match in self.graph.objects(conceptURI, _SKOS_EXACT_MATCH):
             if match != self.uri and match != conceptURI:
-                self._addTriple( (self.uri, SKOS.exactMatch, match) )
-                self._addTriple( (self.uri, SKOS.closeMatch, match) )
-        for match in self.graph.objects(self.uri, SKOS.exactMatch):
+                self._addTriple( (self.uri, _SKOS_EXACT_MATCH, match) )
+                self._addTriple( (self.uri, _SKOS_CLOSE_MATCH, match) )
+        for match in self.graph.objects(self.uri, _SKOS_EXACT_MATCH):
             if match != self.uri and match != conceptURI:
-                self._addTriple( (conceptURI, SKOS.exactMatch, match) )
-                self._addTriple( (conceptURI, SKOS.closeMatch, match) )
+                self._addTriple( (conceptURI, _SKOS_EXACT_MATCH, match) )
+                self._addTriple( (conceptURI, _SKOS_CLOSE_MATCH, match) )
 
         return triple
     
@@ -969,7 +1031,7 @@ class Concept(SKOSSubject):
             If note was a string or literal, then newNote is the PlainLiteral created from note & lang. If note was a blank node or URI reference, then newNote is note.
 
         """
-        return self.addNote(note, lang, SKOS.example)
+        return self.addNote(note, lang, _SKOS_EXAMPLE)
 
     def addHiddenLabel(self, literal, lang=None):
         """
@@ -988,7 +1050,7 @@ class Concept(SKOSSubject):
             The triple that represents the label.
 
         """
-        return self._addLabel(SKOS.hiddenLabel, literal, lang)
+        return self._addLabel(_SKOS_HIDDEN_LABEL, literal, lang)
         
     def addHistoryNote(self, note, lang=None):
         """
@@ -1007,7 +1069,7 @@ class Concept(SKOSSubject):
             If note was a string or literal, then newNote is the PlainLiteral created from note & lang. If note was a blank node or URI reference, then newNote is note.
 
         """
-        return self.addNote(note, lang, SKOS.historyNote)
+        return self.addNote(note, lang, _SKOS_HISTORY_NOTE)
         
     def addNarrower(self, concept, irreflexive=False):
         """
@@ -1025,22 +1087,7 @@ class Concept(SKOSSubject):
         triple : 3-tuple
             The triple created by this method.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.narrower)
-                
-        self._testReflexive(triple, irreflexive)
-                          
-        inSameScheme = self._testSameScheme(concept)
-        
-        if inSameScheme == False:
-            raise ImproperAssociationError(triple)
-            
-        if (self.uri, SKOS.related, conceptURI) in self.graph or \
-            (conceptURI, SKOS.related, self.uri) in self.graph:
-            raise DisjointRelationError(triple)
-            
-        self._addRelationship(triple, (conceptURI, SKOS.broader, self.uri) )
-        
-        return triple
+        return self._relate(concept, _SKOS_NARROWER, irreflexive)
     
     def addNarrowerTransitive(self, concept, irreflexive=False):
         #TODO: implement this
@@ -1049,7 +1096,6 @@ class Concept(SKOSSubject):
         raise NotImplementedError
         
     def addNarrowMatch(self, concept):
-        #TODO: Left off the _addRelationships split here.
         """
         Add a skos:narrowMatch relationship between the concept supplied to the method (the narrower concept) and the concept from which the method is called (the broader concept). The concepts must be in different concept schemes.
 
@@ -1063,18 +1109,7 @@ class Concept(SKOSSubject):
         triple : 3-tuple
             The triple created by this method.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.narrowMatch)
-                
-        self._testReflexive(triple, True)
-                          
-        inSameScheme = self._testSameScheme(concept)
-        
-        if inSameScheme == True:
-            raise ImproperMappingError(triple)
-            
-        self._addRelationship(triple, (conceptURI, SKOS.broadMatch, self.uri) )
-            
-        return triple
+        return self._relate(concept, _SKOS_NARROW_MATCH, True)
     
     def addNotation(self, notation):    
         #TODO: Add support for SKOS.notation https://www.w3.org/TR/skos-reference/#L2064
@@ -1099,21 +1134,44 @@ class Concept(SKOSSubject):
             If note was a string or literal, then newNote is the PlainLiteral created from note & lang. If note was a blank node or URI reference, then newNote is note.
 
         """
-        if isinstance(note, str) or isinstance(note, rdflib.term.Literal):
-            newNote = _cleanUpPlainLiteral(note, lang)
-        elif isinstance(note, rdflib.term.BNode) or isinstance(note, rdflib.term.URIRef):
-            newNote = note
-        else:
-            newNote = PlainLiteral(str(note), lang)
+        newNote = _cleanUpNote(note, lang)
 
         if predicate in SKOSNotes:
             self._addTriple( (self.uri, predicate, newNote) )
         else:
-            self._addTriple( (self.uri, SKOS.note, newNote) )
-            logger.warning("Inappropriate predicate used on a note: {}".format(predicate))
+            self._addTriple( (self.uri, _SKOS_NOTE, newNote) )
+            logger.warning("Inappropriate predicate used on a note: %s", predicate)
         
         return newNote
     
+    def addNotes(self, notes, predicate=_SKOS_NOTE):
+        """
+        Adds several notes that use the same note predicate. The predicate is checked once for all of the notes.
+
+        Parameters
+        ----------
+        notes : iterable of 2-tuples
+            (note, lang) pairs, where note and lang are the same as the arguments of addNote.
+        predicate : rdflib.term.URIref, optional
+            A note predicate from the SKOS standard (https://www.w3.org/TR/skos-primer/#secdocumentation). The default is SKOS.note.
+
+        Returns
+        -------
+        newNotes : list
+            The notes that were added, in the same form addNote returns them.
+
+        """
+        if predicate not in SKOSNotes:
+            logger.warning("Inappropriate predicate used on a note: %s", predicate)
+            predicate = _SKOS_NOTE
+        
+        newNotes = [_cleanUpNote(note, lang) for note, lang in notes]
+        
+        for newNote in newNotes:
+            self._addTriple( (self.uri, predicate, newNote) )
+        
+        return newNotes
+    
     def addPrefLabel(self, literal, lang=None, replace=False):
         """
         Adds a preferred label for the concept.
@@ -1133,16 +1191,16 @@ class Concept(SKOSSubject):
             The triple that represents the label.
 
         """
-        for pl in self.graph.objects(self.uri, SKOS.prefLabel):
+        for pl in self.graph.objects(self.uri, _SKOS_PREF_LABEL):
             # pl stands for plain literal
             if pl.language == lang:
-                t = (self.uri, SKOS.prefLabel, pl)
+                t = (self.uri, _SKOS_PREF_LABEL, pl)
                 if replace == False:
                     raise RedundantLabelError(t)
                 else:
                     self.graph.remove(t)
         
-        return self._addLabel(SKOS.prefLabel, literal, lang)
+        return self._addLabel(_SKOS_PREF_LABEL, literal, lang)
         
     def addRelated(self, concept, irreflexive=False):
         """
@@ -1160,19 +1218,10 @@ class Concept(SKOSSubject):
         triple : 3-tuple
             The triple created by this method.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.related)
-                
-        self._testReflexive(triple, True)
-                          
-        inSameScheme = self._testSameScheme(concept)
-        
-        if inSameScheme == False:
-            raise ImproperMappingError(triple)
-            
-        self._addRelationship(triple, (conceptURI, SKOS.related, self.uri) )
-            
-        return triple
-        
+        #The irreflexive flag has never been used here; related concepts are
+        # always irreflexive.
+        return self._relate(concept, _SKOS_RELATED, True)
+    
     def addRelatedMatch(self, concept):
         """
         Add a skos:relatedMatch relationship between the concept supplied to the method and the concept from which the method is called. The concepts must be in different concept schemes.
@@ -1187,19 +1236,8 @@ class Concept(SKOSSubject):
         triple : 3-tuple
             The triple created by this method.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.relatedMatch)
-                
-        self._testReflexive(triple, True)
-                          
-        inSameScheme = self._testSameScheme(concept)
-        
-        if inSameScheme == True:
-            raise ImproperMappingError(triple)
-            
-        self._addRelationship(triple, (conceptURI, SKOS.relatedMatch, self.uri) )
-            
-        return triple
-        
+        return self._relate(concept, _SKOS_RELATED_MATCH, True)
+    
     def addScopeNote(self, note, lang=None):
         """
         Adds a scope note triple. Scope notes typically are, but do not have to be, plain literals. They can also be blank nodes or URIs of other documents. Source: https://www.w3.org/TR/skos-primer/#secadvanceddocumentation
@@ -1217,7 +1255,7 @@ class Concept(SKOSSubject):
             If note was a string or literal, then newNote is the PlainLiteral created from note & lang. If note was a blank node or URI reference, then newNote is note.
 
         """
-        return self.addNote(note, lang, SKOS.scopeNote)
+        return self.addNote(note, lang, _SKOS_SCOPE_NOTE)
     
     def addToScheme(self, scheme):
         """
@@ -1240,55 +1278,55 @@ class Concept(SKOSSubject):
         """
         Returns a generator of concept schemes that the concept is in.
         """
-        return self._getObjects(SKOS.inScheme)
+        return self._getObjects(_SKOS_IN_SCHEME)
     
     def getBroaderConcepts(self):
         """
         Returns a generator of broader concepts.
         """
-        return self._getObjects(SKOS.broader)
+        return self._getObjects(_SKOS_BROADER)
             
     def getBroaderTransitiveConcepts(self):
         """
         Returns a generator of broader (transitive) concepts.
         """
-        return self._getObjects(SKOS.broaderTransitive)
+        return self._getObjects(_SKOS_BROADER_TRANSITIVE)
     
     def getBroadMatches(self):
         """
         Returns a generator of broader matches.
         """
-        return self._getObjects(SKOS.broadMatch)
+        return self._getObjects(_SKOS_BROAD_MATCH)
     
     def getCloseMatches(self):
         """
         Returns a generator of close matches and exact matches.
         """
-        return self._getObjects(SKOS.closeMatch)
+        return self._getObjects(_SKOS_CLOSE_MATCH)
     
     def getExactMatches(self):
         """
         Returns a generator of exact matches.
         """
-        return self._getObjects(SKOS.exactMatch)
+        return self._getObjects(_SKOS_EXACT_MATCH)
             
     def getNarrowerConcepts(self):
         """
         Returns a generator of narrower concepts.
         """
-        return self._getObjects(SKOS.narrower)
+        return self._getObjects(_SKOS_NARROWER)
     
     def getNarrowerTransitiveConcepts(self):
         """
         Returns a generator of narrower (transitive) concepts.
         """
-        return self._getObjects(SKOS.narrowerTransitive)
+        return self._getObjects(_SKOS_NARROWER_TRANSITIVE)
     
     def getNarrowMatches(self):
         """
         Returns a generator of narrower matches.
         """
-        return self._getObjects(SKOS.narrowMatch)
+        return self._getObjects(_SKOS_NARROW_MATCH)
         
     def getPrefLabel(self, lang=None):
         """
@@ -1309,7 +1347,7 @@ class Concept(SKOSSubject):
             if label.language == lang:
                 return label
 
-        logger.info("No label for language, {}".format(lang))
+        logger.info("No label for language, %s", lang)
             
         return None
     
@@ -1317,19 +1355,19 @@ class Concept(SKOSSubject):
         """
         Returns a generator of preferred labels (one for each language tag).
         """
-        return self._getObjects(SKOS.prefLabel)
+        return self._getObjects(_SKOS_PREF_LABEL)
     
     def getRelated(self):
         """
         Returns a generator of related concepts.
         """
-        return self._getObjects(SKOS.related)
+        return self._getObjects(_SKOS_RELATED)
     
     def getRelatedMatches(self):
         """
         Returns a generator of related matches.
         """
-        return self._getObjects(SKOS.relatedMatch)
+        return self._getObjects(_SKOS_RELATED_MATCH)
     
     def inConceptScheme(self, scheme):
         """
@@ -1348,19 +1386,19 @@ class Concept(SKOSSubject):
         """
         schemeURI = easyURI(scheme)
         
-        return (self.uri, SKOS.inScheme, schemeURI) in self.graph
+        return (self.uri, _SKOS_IN_SCHEME, schemeURI) in self.graph
     
     def removeFromConceptScheme(self, scheme):
         """
         Removes the concept from a concept scheme.
         """
-        schemeURI, triple = self._easyTriple(scheme, SKOS.inScheme)
+        schemeURI, triple = self._easyTriple(scheme, _SKOS_IN_SCHEME)
         
         self.graph.remove(triple)
         
         self.graph.remove( (schemeURI, SKOS.hasConcept, self.uri) )
         
-        self.graph.remove( (self.uri, SKOS.topConceptOf, schemeURI) )
+        self.graph.remove( (self.uri, _SKOS_TOP_CONCEPT_OF, schemeURI) )
         
         return triple
 
@@ -1368,13 +1406,7 @@ class Concept(SKOSSubject):
         """
         Removes a the broader-narrower relationship between the passed concept (broader) and this concept (narrower).
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.broader)
-        
-        self.graph.remove(triple)
-        
-        self.graph.remove( (conceptURI, SKOS.narrower, self.uri) )
-        
-        return triple
+        return self._unrelate(concept, _SKOS_BROADER)[1]
             
     def removeBroaderTransitive(self):
         """
@@ -1387,25 +1419,19 @@ class Concept(SKOSSubject):
         """
         Removes a the broader-narrower mapping between the passed concept (broader) and this concept (narrower).
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.broadMatch)
-        
-        self.graph.remove(triple)
-        
-        self.graph.remove( (conceptURI, SKOS.narrowMatch, self.uri) )
-        
-        return triple
+        return self._unrelate(concept, _SKOS_BROAD_MATCH)[1]
     
     def removeCloseMatch(self, concept):
         """
         Removes the close and exact matches between this concept and the passed concept.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.closeMatch)
-        
-        self.graph.remove(triple)
+        conceptURI, triple = self._unrelate(concept, _SKOS_CLOSE_MATCH)
         
-        self.graph.remove( (conceptURI, SKOS.closeMatch, self.uri) )
+        # conceptURI is already resolved, so the exact matches are removed
+        # here instead of through removeExactMatch.
+        self.graph.remove( (self.uri, _SKOS_EXACT_MATCH, conceptURI) )
         
-        self.removeExactMatch(concept)
+        self.graph.remove( (conceptURI, _SKOS_EXACT_MATCH, self.uri) )
         
         return triple
     
@@ -1413,25 +1439,13 @@ class Concept(SKOSSubject):
         """
         Removes the exact matches between this concept and the passed concept.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.exactMatch)
-        
-        self.graph.remove(triple)
-
-        self.graph.remove( (conceptURI, SKOS.exactMatch, self.uri) )
-        
-        return triple
+        return self._unrelate(concept, _SKOS_EXACT_MATCH)[1]
             
     def removeNarrower(self, concept):
         """
         Removes a the broader-narrower relationship between the passed concept (narrower) and this concept (broader).
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.narrower)
-        
-        self.graph.remove(triple)
-        
-        self.graph.remove( (conceptURI, SKOS.broader, self.uri) )
-        
-        return triple
+        return self._unrelate(concept, _SKOS_NARROWER)[1]
     
     def removeNarrowerTransitive(self):
         """
@@ -1444,13 +1458,7 @@ class Concept(SKOSSubject):
         """
         Removes a the broader-narrower relationship between the passed concept (narrower) and this concept (broader).
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.narrowMatch)
-        
-        self.graph.remove(triple)
-        
-        self.graph.remove( (conceptURI, SKOS.broadMatch, self.uri) )
-        
-        return triple
+        return self._unrelate(concept, _SKOS_NARROW_MATCH)[1]
         
     def removePrefLabel(self, language):
         """
@@ -1458,11 +1466,11 @@ class Concept(SKOSSubject):
         """
         for label in self.getPrefLabels():
             if label.language == language:
-                triple = (self.uri, SKOS.prefLabel, label)
+                triple = (self.uri, _SKOS_PREF_LABEL, label)
                 self.graph.remove(triple)
                 return triple
     
-        logger.info("No label for language, {}".format(language))
+        logger.info("No label for language, %s", language)
             
         return None
     
@@ -1470,43 +1478,26 @@ class Concept(SKOSSubject):
         """
         Removes the related relationship between this concept and the passed concept.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.related)
-        
-        self.graph.remove(triple)
-
-        self.graph.remove( (conceptURI, SKOS.related, self.uri) )
-        
-        return triple
+        return self._unrelate(concept, _SKOS_RELATED)[1]
     
     def removeRelatedMatch(self, concept):
         """
         Removes the related mapping between this concept and the passed concept.
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.relatedMatch)
-        
-        self.graph.remove(triple)
-
-        self.graph.remove( (conceptURI, SKOS.relatedMatch, self.uri) )
-        
-        return triple
+        return self._unrelate(concept, _SKOS_RELATED_MATCH)[1]
 
 class ConceptScheme(SKOSSubject):
     """Concepts belong to concept schemes."""
+    
+    __slots__ = ()
 
-    def __init__(self, URI):
+    def __init__(self, URI, graph=None):
         
-        SKOSSubject.__init__(self, URI)
+        SKOSSubject.__init__(self, URI, graph)
         
-        triple = (self.uri, RDF.type, SKOS.ConceptScheme)
+        triple = (self.uri, _RDF_TYPE, _SKOS_CONCEPT_SCHEME)
         
-        notAConcept = (self.uri, RDF.type, SKOS.Concept) not in self.graph
-        
-        notACollection = (self.uri, RDF.type, SKOS.Collection) not in self.graph
-        
-        if notAConcept and notACollection:
-            self._addTriple(triple)
-        else:
-            raise SchemeConceptError(triple)
+        self._addType(triple, (_SKOS_CONCEPT, _SKOS_COLLECTION))
     
     def addConcept(self, concept):
         """
@@ -1525,7 +1516,7 @@ class ConceptScheme(SKOSSubject):
         """
         conceptURI = easyURI(concept)
         
-        triple = (conceptURI, SKOS.inScheme, self.uri)
+        triple = (conceptURI, _SKOS_IN_SCHEME, self.uri)
         
         self._addTriple( triple )
 
@@ -1546,32 +1537,22 @@ class ConceptScheme(SKOSSubject):
             The URI of the concept that is added to the scheme.
 
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.hasTopConcept)
+        conceptURI, triple = self._easyTriple(concept, _SKOS_HAS_TOP_CONCEPT)
         
         #if concept has a broader concept in the same scheme, raise error.
-        broaderConcepts = set( concept.getBroaderConcepts() )
-        
-        broaderTConcepts = set( concept.getBroaderTransitiveConcepts() )
-        
-        narrowerConcepts = set( self.graph.subjects(SKOS.narrower, conceptURI) )
-        
-        narrowerTConcepts = set( self.graph.subjects(SKOS.narrowerTransitive, conceptURI) )
-        
-        allBroaderConcepts = broaderConcepts.union(broaderTConcepts, narrowerConcepts, narrowerTConcepts)
-    
-        hasBroaderConcept = bool( allBroaderConcepts )
-        
-        inSameScheme = False
-        
-        for bigConcept in allBroaderConcepts:
-            inSameScheme = inSameScheme or ( (bigConcept, SKOS.inScheme, self.uri) in self.graph )
-                    
-        if hasBroaderConcept and inSameScheme:
+        # The search stops at the first broader concept found in the scheme.
+        allBroaderConcepts = itertools.chain( concept.getBroaderConcepts(), \
+            concept.getBroaderTransitiveConcepts(), \
+            self.graph.subjects(_SKOS_NARROWER, conceptURI), \
+            self.graph.subjects(_SKOS_NARROWER_TRANSITIVE, conceptURI) )
+        
+        if any( (bigConcept, _SKOS_IN_SCHEME, self.uri) in self.graph \
+               for bigConcept in allBroaderConcepts ):
             raise TopConceptError(triple)
 
         self._addTriple(triple)
         
-        self._addTriple( (conceptURI, SKOS.topConceptOf, self.uri) )
+        self._addTriple( (conceptURI, _SKOS_TOP_CONCEPT_OF, self.uri) )
         
         self.addConcept(concept)
 
@@ -1601,13 +1582,15 @@ class ConceptScheme(SKOSSubject):
         def addSubjectsToList(p, o):
             nonlocal subjects
             nonlocal self
-            for subj in self.graph.subjects(SKOS.inScheme, self.uri):
-                if (subj, p, o) in self.graph:
+            # Only the subjects with the label are checked for membership in
+            # the scheme, rather than checking every member for the label.
+            for subj in self.graph.subjects(p, o):
+                if (subj, _SKOS_IN_SCHEME, self.uri) in self.graph:
                     subjects.add(subj)
             return None
         
         if prefLabelOnly == True:
-            addSubjectsToList(SKOS.prefLabel, newLabel)
+            addSubjectsToList(_SKOS_PREF_LABEL, newLabel)
             return subjects
         else:
             for skosLabel in SKOSLabels:
@@ -1615,17 +1598,19 @@ class ConceptScheme(SKOSSubject):
             return subjects
         
     def getConcepts(self):
-        return self.graph.subjects(SKOS.inScheme, self.uri)
+        return self.graph.subjects(_SKOS_IN_SCHEME, self.uri)
         
     #TODO: Add functions that can clean concept schemes in case concept relationships are added before the concept is added to a concept scheme.
     
 class Collection(SKOSSubject):
     #TODO: implement this class to match https://www.w3.org/TR/skos-primer/#seccollections 
-    def __init__(self, URI=None):
+    __slots__ = ()
+    
+    def __init__(self, URI=None, graph=None):
         
         global masterGraph
         
-        self.graph = masterGraph
+        self.graph = masterGraph if graph is None else graph
         
         if isinstance(URI, rdflib.URIRef) or isinstance(URI, rdflib.BNode):
             self.uri = URI
@@ -1634,16 +1619,9 @@ class Collection(SKOSSubject):
         else:
             self.uri = rdflib.URIRef(URI)
             
-        triple = (self.uri, RDF.type, SKOS.Collection)
+        triple = (self.uri, _RDF_TYPE, _SKOS_COLLECTION)
         
-        notAConcept = (self.uri, RDF.type, SKOS.Concept) not in self.graph
-        
-        notAConceptScheme = (self.uri, RDF.type, SKOS.ConceptScheme) not in self.graph
-        
-        if notAConcept and notAConceptScheme:
-            self._addTriple(triple)
-        else:
-            raise SchemeConceptError(triple)
+        self._addType(triple, (_SKOS_CONCEPT, _SKOS_CONCEPT_SCHEME))
     
     def addMember(self, concept):
         """
@@ -1660,7 +1638,7 @@ class Collection(SKOSSubject):
             The triple that was added to the graph.
 
         """
-        conceptURI, triple = self._easyTriple(concept, SKOS.member)
+        conceptURI, triple = self._easyTriple(concept, _SKOS_MEMBER)
         
         return self._addTriple(triple)
     
@@ -1707,10 +1685,10 @@ class Collection(SKOSSubject):
 
         """
         #TODO: This function is a good example of why SKOS properties should be Python objects.
-        for pl in self.graph.objects(self.uri, SKOS.prefLabel):
+        for pl in self.graph.objects(self.uri, _SKOS_PREF_LABEL):
             # pl stands for plain literal
             if pl.language == lang:
-                t = (self.uri, SKOS.prefLabel, pl)
+                t = (self.uri, _SKOS_PREF_LABEL, pl)
                 if replace == False:
                     raise RedundantLabelError(t)
                 else:
@@ -1718,28 +1696,30 @@ class Collection(SKOSSubject):
                     
         newLiteral = _cleanUpPlainLiteral(literal, lang)
         
-        triple = (self.uri, SKOS.prefLabel, newLiteral)
+        triple = (self.uri, _SKOS_PREF_LABEL, newLiteral)
         
-        for label in SKOSLabels:
-            for RDFObject in self.graph.objects(self.uri, label):
-                if RDFObject == newLiteral:
-                    #A literal cannot be the object of more than one label predicate. In other words, you can't have the same string as hidden label and an alternate label.
-                    raise ConflictingLabelError(triple)
+        #A literal cannot be the object of more than one label predicate. In other words, you can't have the same string as hidden label and an alternate label.
+        for RDFPredicate in self.graph.predicates(self.uri, newLiteral):
+            if RDFPredicate in SKOSLabels:
+                raise ConflictingLabelError(triple)
         
         return self._addTriple(triple)
 
 class OrderedCollection(Collection):
     #TODO: implement this class to match https://www.w3.org/TR/skos-primer/#seccollections
     # raise NotImplementedError
-    pass
+    __slots__ = ()
 
 # =============================================================================
 # Utility functions (functions intended for use outside the module)
 # =============================================================================
 
-def readFromFile(filepath):
+def readFromFile(filepath, graph=None):
 
     global masterGraph
+    
+    if graph is None:
+        graph = masterGraph
 
     index = filepath.rfind(".")
 
@@ -1747,9 +1727,9 @@ def readFromFile(filepath):
     
     # fmat = rdflib.util.guess_format(filepath)
 
-    with open(filepath, 'r') as fileObject:
-        masterGraph.parse(format=extension, file=fileObject)
-        # masterGraph.parse(format=fmat, file=fileObject)
+    # rdflib opens the file itself (in binary mode) and decodes it as it parses
+    graph.parse(source=filepath, format=extension)
+    # graph.parse(source=filepath, format=fmat)
 
     conceptSchemes = dict()
 
@@ -1757,19 +1737,16 @@ def readFromFile(filepath):
     
     collections = dict()
 
-#TODO: Turn the following loops into an inner function that can be called with the different classes and URIs as arguments.
+    # Each SKOS class maps to the dictionary its instances go in and the
+    # class that wraps them, so the rdf:type triples are only scanned once.
+    dispatch = {_SKOS_CONCEPT_SCHEME: (conceptSchemes, ConceptScheme),
+                _SKOS_CONCEPT: (concepts, Concept),
+                _SKOS_COLLECTION: (collections, Collection)}
 
-    for subject in masterGraph.subjects(RDF.type, SKOS.ConceptScheme):
-        key = str(subject)
-        conceptSchemes[key] = ConceptScheme(subject)
-
-    for subject in masterGraph.subjects(RDF.type, SKOS.Concept):
-        key = str(subject)
-        concepts[key] = Concept(subject)
-        
-    for subject in masterGraph.subjects(RDF.type, SKOS.Collection):
-        key = str(subject)
-        collections[key] = Collection(subject)
+    for subject, _, RDFType in graph.triples((None, _RDF_TYPE, None)):
+        target = dispatch.get(RDFType)
+        if target is not None:
+            target[0][str(subject)] = target[1](subject, graph)
 
     #TODO: Finish this. It needs to check the imported graph for inconsistencies.
 
@@ -1777,5 +1754,7 @@ def readFromFile(filepath):
 
 #Note to self: Until I have a good reason to, I am not going to mess with advanced labels: https://www.w3.org/TR/skos-primer/#secrelationshipslabels
 
-def writeToFile(filepath, fileFormat='ttl'):
-    masterGraph.serialize(filepath, fileFormat)
\ No newline at end of file
+def writeToFile(filepath, fileFormat='ttl', graph=None):
+    if graph is None:
+        graph = masterGraph
+    graph.serialize(filepath, fileFormat)
\ No newline at end of file
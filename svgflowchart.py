@@ -7,9 +7,15 @@ Created on Fri Jul 12 10:22:52 2019
 
 import svgwrite
 import math
+import io
 import logging
 
-logger = logging.getLogger(__name__).addHandler(logging.NullHandler)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Constants used when drawing shapes
+_SQRT3 = math.sqrt(3)
+_TWO_OVER_SQRT3 = 2 / _SQRT3
 
 def quadratic_formula(A, B, C):
 
@@ -27,7 +33,27 @@ def quadratic_formula(A, B, C):
 def distance_formula(pt1, pt2):
     
     # pt1 and pt2 are tuples of x-y coordinates
-    return math.sqrt((pt1[0]-pt2[0])**2 + (pt1[1]-pt2[1])**2)
+    return math.hypot(pt1[0]-pt2[0], pt1[1]-pt2[1])
+
+def _arrowheadOffsets(DeltaX, DeltaY, length, l, w):
+    
+    # Returns the offsets of the two arrowhead points from the arrow's head.
+    # l is the arrowhead length and w is half of the arrowhead width.
+    #cos(alpha) and sin(alpha) are the components of the arrow's unit
+    # vector, so no trig calls are needed. A zero length arrow points
+    # along the x-axis, matching atan2(0, 0) = 0.
+    if length != 0:
+        cosAlpha = DeltaX / length
+        sinAlpha = DeltaY / length
+    else:
+        cosAlpha = 1.0
+        sinAlpha = 0.0
+    
+    #The base of the arrowhead is at alpha +/- pi/2, so
+    # cos(alpha + pi/2) = -sin(alpha), sin(alpha + pi/2) = cos(alpha), and
+    # vice versa for alpha - pi/2.
+    return ((-l*cosAlpha - w*sinAlpha, -l*sinAlpha + w*cosAlpha), \
+            (-l*cosAlpha + w*sinAlpha, -l*sinAlpha - w*cosAlpha))
 
 # Each shape inherits shared variables and methods from the Shape class as well
 # as an svgwrite class.
@@ -40,10 +66,7 @@ class Shape():
             assert isinstance(pt, tuple), assertionErrorString
             assert len(pt)==2, assertionErrorString
         self.verticies = pts
-        self.maxX = self.maxMinXY()[0]
-        self.maxY = self.maxMinXY()[1]
-        self.minX = self.maxMinXY()[2]
-        self.minY = self.maxMinXY()[3]
+        self.maxX, self.maxY, self.minX, self.minY = self.maxMinXY()
         
     def maxMinXY(self):
         xMax = self.verticies[0][0]
@@ -57,6 +80,24 @@ class Shape():
             if y < yMin : yMin = y
         return [xMax, yMax, xMin, yMin]
     
+    def _setAnchors(self, insert, w, h):
+        # Sets the size, the "radii", and the center and edge midpoints of a
+        # shape that fills the box with upper left corner insert and size
+        # (w, h). Each subexpression is only computed once.
+        rx = w*0.5
+        ry = h*0.5
+        cx = insert[0] + rx
+        cy = insert[1] + ry
+        self.w = w # width
+        self.h = h # height
+        self.rx = rx # x "radius"
+        self.ry = ry # y "radius"
+        self.cc = (cx, cy)
+        self.cb = (cx, insert[1] + h)
+        self.cl = (insert[0], cy)
+        self.cr = (insert[0] + w, cy)
+        self.ct = (cx, insert[1])
+    
 #Define shapes and drawing functions here
 # Square
 class Box(svgwrite.shapes.Rect, Shape):
@@ -64,34 +105,18 @@ class Box(svgwrite.shapes.Rect, Shape):
     def __init__(self, insert=(0, 0), size=(1, 1), **extra):
         svgwrite.shapes.Rect.__init__(self, insert, size, None, None, \
                                       **extra)
-        self.w = size[0] # width
-        self.h = size[1] # height
-        self.rx = self.w/2 # x "radius"
-        self.ry = self.h/2 # y "radius"
-        self.bl = (insert[0], insert[1] + self.h)
-        self.br = (insert[0] + self.w, insert[1] + self.h)
+        self._setAnchors(insert, size[0], size[1])
+        self.bl = (self.cl[0], self.cb[1])
+        self.br = (self.cr[0], self.cb[1])
         self.tl = insert
-        self.tr = (insert[0] + self.w, insert[1])
-        self.cc = ( (2 * insert[0] + self.w)/2, (2 * insert[1] + self.h)/2 )
-        self.cb = (self.cc[0], self.bl[1])
-        self.cl = (self.bl[0], self.cc[1])
-        self.cr = (self.br[0], self.cc[1])
-        self.ct = (self.cc[0], self.tl[1])
+        self.tr = (self.cr[0], self.ct[1])
         Shape.__init__(self, [self.tl, self.tr, self.br, self.bl])
         
 # Diamond
 class Diamond(svgwrite.shapes.Polygon, Shape):
     
     def __init__(self, insert=(0, 0), size=(1, 1), **extra):
-        self.w = size[0] # width
-        self.h = size[1] # height
-        self.rx = self.w/2 # x "radius"
-        self.ry = self.h/2 # y "radius"
-        self.cc = ( (2 * insert[0] + self.w)/2, (2 * insert[1] + self.h)/2 )
-        self.cb = (self.cc[0], self.cc[1] + self.ry)
-        self.cl = (self.cc[0] - self.rx, self.cc[1])
-        self.cr = (self.cc[0] + self.rx, self.cc[1])
-        self.ct = (self.cc[0], self.cc[1] - self.ry)
+        self._setAnchors(insert, size[0], size[1])
         Shape.__init__(self, [self.ct, self.cr, self.cb, self.cl])
         svgwrite.shapes.Polygon.__init__(self, self.verticies, **extra)
 
@@ -99,35 +124,27 @@ class Diamond(svgwrite.shapes.Polygon, Shape):
 class Oval(svgwrite.shapes.Ellipse, Shape):
     
     def __init__(self, insert=None, center=None, r=None, **extra):
-        if r == None and insert != None and center !=None:
+        if r is None and insert is not None and center is not None:
             #Define ellipse by upper left corner point and center point
             r = (center[0] - insert[0], center[1] - insert[1])
-        elif center == None and insert != None and r !=None:
+        elif center is None and insert is not None and r is not None:
             #Define ellipse by upper left corner point and radii
             center = (insert[0] + r[0], insert[1] + r[1])
-        elif insert == None and center != None and r != None:
+        elif insert is None and center is not None and r is not None:
             #Define ellipse by center point and radii
             insert = (center[0] - r[0], center[1] - r[1])
-        elif insert != None and center != None and r != None:
+        elif insert is not None and center is not None and r is not None:
             #Define ellipse by center point and radii
             insert = (center[0] - r[0], center[1] - r[1])
             logger.warning("""Creation of Oval object defined too many arguments: 
-                           insert = {0}
-                           center = {1}
-                           r      = {2}
-                           Only center and r will be used.""".format(insert, center, r) )
+                           insert = %s
+                           center = %s
+                           r      = %s
+                           Only center and r will be used.""", insert, center, r)
         else:
             raise Exception('Too many arguments passed to Oval with values of None.')
         svgwrite.shapes.Ellipse.__init__(self, center, r, **extra)
-        self.rx = r[0] # x radius
-        self.ry = r[1] # y radius
-        self.w = 2 * self.rx # width
-        self.h = 2 * self.ry # height
-        self.cc = center
-        self.cb = (self.cc[0], self.cc[1] + self.ry)
-        self.cl = (self.cc[0] - self.rx, self.cc[1])
-        self.cr = (self.cc[0] + self.rx, self.cc[1])
-        self.ct = (self.cc[0], self.cc[1] - self.ry)
+        self._setAnchors(insert, 2 * r[0], 2 * r[1])
         Shape.__init__(self, [self.ct, self.cr, self.cb, self.cl])
 
 # Triangle
@@ -153,11 +170,11 @@ class EquilateralTriangle(Triangle):
         y_2 = vertex1[1]
         # By default, the triangle is drawn clockwise
         if CW == True:
-            vertex2 = ( ( x_1 + x_2 + math.sqrt(3) * (y_1 - y_2) )/2, \
-                     ( y_1 + y_2 + math.sqrt(3) * (x_2 - x_1) )/2 )
+            vertex2 = ( 0.5 * ( x_1 + x_2 + _SQRT3 * (y_1 - y_2) ), \
+                     0.5 * ( y_1 + y_2 + _SQRT3 * (x_2 - x_1) ) )
         else:
-            vertex2 = ( ( x_1 + x_2 - math.sqrt(3) * (y_1 - y_2) )/2, \
-                     ( y_1 + y_2 - math.sqrt(3) * (x_2 - x_1) )/2 )
+            vertex2 = ( 0.5 * ( x_1 + x_2 - _SQRT3 * (y_1 - y_2) ), \
+                     0.5 * ( y_1 + y_2 - _SQRT3 * (x_2 - x_1) ) )
         Triangle.__init__(self, insert, vertex1, vertex2, **extra)
 
 # Arrow
@@ -177,44 +194,89 @@ class Arrow(svgwrite.path.Path, Shape):
         DeltaX = E_x - S_x
         DeltaY = E_y - S_y
         #Arrow's total length
-        self.length = distance_formula(start, end)
+        self.length = math.hypot(DeltaX, DeltaY)
         #Arrow's angle with the x-axis
         self.angle = math.atan2(DeltaY, DeltaX)
-        if arrowHeadLength >= self.length or arrowHeadLength < 0:
-            self.ahl = 0.1*self.length
-        else:
-            self.ahl = arrowHeadLength
-        if arrowHeadWidth >= self.ahl or arrowHeadWidth < 0:
-            self.ahw = 2 * self.ahl / math.sqrt(3)
-        else:
-            self.ahw = arrowHeadWidth
-        
-        #These variables make the math easier to read later
-        l = self.ahl
-        w = self.ahw/2
-        alpha = self.angle
-        beta = math.pi/2 + alpha
-        gamma = alpha - math.pi/2
-        
-        #(x_0, y_0) is the intersection of the base of the arrowhead and the
-        # arrow.
-        x_0 = E_x - l*math.cos(alpha)
-        y_0 = E_y - l*math.sin(alpha)
+        #Arrowhead sizes that are out of range fall back to the defaults
+        self.ahl = arrowHeadLength if 0 <= arrowHeadLength < self.length \
+                   else 0.1*self.length
+        self.ahw = arrowHeadWidth if 0 <= arrowHeadWidth < self.ahl \
+                   else self.ahl * _TWO_OVER_SQRT3
         
-        #solve for the arrowhead points
-        x_1 = x_0 + w*math.cos(beta)
-        y_1 = y_0 + w*math.sin(beta)
-        x_2 = x_0 + w*math.cos(gamma)
-        y_2 = y_0 + w*math.sin(gamma)
-        
-        #Start forming the path
-        svgwrite.path.Path.__init__(self, d='M {0} {1}'.format(start[0], \
-                                    start[1]), **extra)
-        self.push('L {0} {1}'.format(end[0], end[1]))
+        #Form the whole path in one string
+        d = f'M {S_x} {S_y} L {E_x} {E_y}'
         if self.ahl != 0:
-            self.push('M {0} {1}'.format(E_x, E_y)) #starts a subpath using absolute coordinates
-            self.push('L {0} {1}'.format(x_1, y_1))
-            self.push('L {0} {1}'.format(x_2, y_2))
-            self.push('Z')
+            #solve for the arrowhead points
+            (dx_1, dy_1), (dx_2, dy_2) = _arrowheadOffsets(DeltaX, DeltaY, \
+                                            self.length, self.ahl, self.ahw/2)
+            x_1 = E_x + dx_1
+            y_1 = E_y + dy_1
+            x_2 = E_x + dx_2
+            y_2 = E_y + dy_2
+            #starts a subpath using absolute coordinates
+            d += f' M {E_x} {E_y} L {x_1} {y_1} L {x_2} {y_2} Z'
+        else:
+            #Without an arrowhead, both of its points are the arrow's head
+            x_1 = x_2 = E_x
+            y_1 = y_2 = E_y
+        svgwrite.path.Path.__init__(self, d=d, **extra)
         
-        Shape.__init__(self, [self.tail, self.head, (x_1, y_1), (x_2, y_2)])
\ No newline at end of file
+        Shape.__init__(self, [self.tail, self.head, (x_1, y_1), (x_2, y_2)])
+
+# Drawing that is written to its file while it is being built
+class StreamingDrawing(svgwrite.Drawing):
+    
+    # Use it as a context manager instead of calling save():
+    #     with StreamingDrawing('flowchart.svg') as dwg:
+    #         dwg.add(shape)
+    # Shapes added inside the with block are written to the file and are not
+    # kept in the drawing, so memory use does not grow with the size of the
+    # flowchart. Anything added before entering the block (defs, for example)
+    # is written as part of the header.
+    # The last element added stays open until the next one is added or the
+    # block ends, so the usual
+    #         g = dwg.add(dwg.g())
+    #         g.add(shape)
+    # still works. Once another element is added to the drawing, anything
+    # added to g is not written.
+    
+    def __init__(self, filename="noname.svg", size=('100%', '100%'), **extra):
+        # Drawing.__init__ adds the defs element, so fileObject must exist
+        self.fileObject = None
+        self.openElement = None
+        svgwrite.Drawing.__init__(self, filename, size, **extra)
+        
+    def __enter__(self):
+        # svgwrite writes the xml declaration, stylesheets, and the svg
+        # element. Everything but the closing tag is the header.
+        header = io.StringIO()
+        self.write(header)
+        header = header.getvalue()
+        self.fileObject = io.open(self.filename, mode='w', encoding='utf-8')
+        self.fileObject.write(header[:header.rindex('</svg>')])
+        return self
+    
+    def add(self, element):
+        if self.fileObject is None:
+            return svgwrite.Drawing.add(self, element)
+        if self.debug:
+            self.validator.check_valid_children(self.elementname, element.elementname)
+        self._writeOpenElement()
+        self.openElement = element
+        return element
+    
+    def _writeOpenElement(self):
+        if self.openElement is not None:
+            self.fileObject.write(self.openElement.tostring())
+            self.openElement = None
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Nothing to close if __enter__ failed or the block already ended
+        if self.fileObject is None:
+            return
+        try:
+            self._writeOpenElement()
+            self.fileObject.write('</svg>')
+        finally:
+            self.fileObject.close()
+            self.fileObject = None
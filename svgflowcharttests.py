@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for svgflowchart. Run from the directory that contains svgflowchart.py.
+"""
+
+import svgflowchart
+import svgwrite
+import io
+import logging
+import os
+import tempfile
+
+# =============================================================================
+# Set up logging
+# =============================================================================
+
+logging.basicConfig(level=logging.INFO)
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Begin tests
+# =============================================================================
+
+logger.info("Begin testing.")
+
+tempDir = tempfile.mkdtemp()
+
+defaultFormat = {'stroke': 'black', 'fill': 'none'}
+
+def addShapes(dwg):
+    # Adds the same shapes to a Drawing or a StreamingDrawing, including a
+    # group whose children are added after the group itself.
+    dwg.add(svgflowchart.Box((10, 10), (100, 50), **defaultFormat))
+    group = dwg.add(dwg.g(id='group'))
+    group.add(svgflowchart.Diamond((10, 70), (100, 50), **defaultFormat))
+    group.add(svgflowchart.Oval(insert=(10, 130), r=(50, 25), **defaultFormat))
+    dwg.add(svgflowchart.Arrow((10, 200), (110, 200), **defaultFormat))
+    lastGroup = dwg.add(dwg.g(id='lastGroup'))
+    lastGroup.add(svgflowchart.Triangle((0, 0), (10, 0), (0, 10)))
+
+def readFile(filename):
+    with io.open(filename, mode='r', encoding='utf-8') as fileObject:
+        return fileObject.read()
+
+#Test that streaming writes the same document as svgwrite
+streamedFile = os.path.join(tempDir, 'streamed.svg')
+savedFile = os.path.join(tempDir, 'saved.svg')
+
+with svgflowchart.StreamingDrawing(streamedFile) as streamedDrawing:
+    addShapes(streamedDrawing)
+
+savedDrawing = svgwrite.Drawing(savedFile)
+addShapes(savedDrawing)
+savedDrawing.save()
+
+streamed = readFile(streamedFile)
+
+if streamed == readFile(savedFile):
+    logger.info("Streamed drawing matches saved drawing test passed.")
+else:
+    logger.info("Streamed drawing matches saved drawing test failed.")
+
+#Test that children added to a group after the group is added are written
+if '<g id="group" /' not in streamed and '<g id="lastGroup" /' not in streamed \
+    and streamed.count('<polygon') == 2:
+    logger.info("Group children test passed.")
+else:
+    logger.info("Group children test failed.")
+
+#Test that streamed elements are not kept in the drawing
+if streamedDrawing.elements == [streamedDrawing.defs]:
+    logger.info("Streamed elements not kept test passed.")
+else:
+    logger.info("Streamed elements not kept test failed.")
+
+#Test that defs added before entering the block are written in the header
+defsFile = os.path.join(tempDir, 'defs.svg')
+
+defsDrawing = svgflowchart.StreamingDrawing(defsFile)
+
+defsDrawing.defs.add(defsDrawing.marker(id='dot'))
+
+with defsDrawing:
+    defsDrawing.add(svgflowchart.Box((0, 0), (10, 10)))
+
+if readFile(defsFile).find('<marker id="dot"') < readFile(defsFile).find('<rect'):
+    logger.info("Defs in header test passed.")
+else:
+    logger.info("Defs in header test failed.")
+
+#Test that leaving the drawing without entering it, or twice, does nothing
+try:
+    unusedDrawing = svgflowchart.StreamingDrawing(os.path.join(tempDir, 'unused.svg'))
+    unusedDrawing.__exit__(None, None, None)
+    defsDrawing.__exit__(None, None, None)
+except AttributeError:
+    logger.info("Exit without open file test failed.")
+else:
+    logger.info("Exit without open file test passed.")
+
+logger.info("End testing.")